@@ -16,8 +16,10 @@ Controls:
     Click: Select planet for details
 """
 
+import functools
 import math
 import random
+import textwrap
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Tuple, Dict, List, Optional
@@ -25,16 +27,27 @@ import numpy as np
 
 import pygame
 
-from planet_data import PLANETS, elements_to_xy, generate_orbit_points
+try:
+    from numba import njit
+except ImportError:  # numba is optional, projection falls back to NumPy
+    njit = None
+
+from planet_data import (PLANETS, PLANET_NAMES, NAME_TO_IDX, days_since_j2000, elements_to_xy_all, 
+                         elements_to_xy_all_from_date, generate_orbit_points, 
+                         load_position_table)
 
 
 # configuration
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 1000
 FPS = 60
+MAX_FRAME_MS = 100  # longer stalls don't jump the simulation forward
 STAR_COUNT = 600
 DEFAULT_ZOOM = 140
 MAX_TRAIL_LENGTH = 200
+TRAIL_SEGMENTS = 4
+SUN_GLOW_ALPHA = 95  # glow opacity where it meets the sun
+ROTATION_STEP = 0.25  # degrees, drag rotations snap to this
 
 # colours
 COLORS = {
@@ -49,6 +62,24 @@ COLORS = {
 }
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _project_kernel(points, R, distance, zoom, cx, cy, out_xy, out_depth):
+        """project_many's rotation, perspective and screen mapping in one pass"""
+        for i in range(points.shape[0]):
+            x, y, z = points[i, 0], points[i, 1], points[i, 2]
+            x_rot = R[0, 0] * x + R[0, 1] * y + R[0, 2] * z
+            y_rot = R[1, 0] * x + R[1, 1] * y + R[1, 2] * z
+            depth = R[2, 0] * x + R[2, 1] * y + R[2, 2] * z
+            
+            scale = zoom * distance / (distance + depth * zoom)
+            out_xy[i, 0] = int(cx + x_rot * scale)
+            out_xy[i, 1] = int(cy - y_rot * scale)
+            out_depth[i] = depth
+else:
+    _project_kernel = None
+
+
 class Camera3D:
     """class handles all 3d camera projection and movement"""
     
@@ -69,40 +100,84 @@ class Camera3D:
         # Follow mode
         self.follow_planet = None
         
+        # bumped whenever anything that affects projection changes,
+        # so anything projected can be cached against it. Code changing
+        # the distance directly has to bump it too, code changing the
+        # rotations calls sync_rotation()
+        self.view_version = 0
+        
+        # rotation_x/rotation_z accumulate freely, projection uses them 
+        # (drags snapped to ROTATION_STEP so small moves keep caches valid)
+        self._view_rotation = (quantize(self.rotation_x, ROTATION_STEP),
+                               quantize(self.rotation_z, ROTATION_STEP))
+        self._matrix_version = None
+        self._matrix = None
+        
     def update_size(self, width: int, height: int):
         self.width = width
         self.height = height
         self.center = (width // 2, height // 2)
+        self.view_version += 1
     
-    def project_3d_to_2d(self, x: float, y: float, z: float, zoom: float) -> Tuple[int, int, float]:
+    def sync_rotation(self, snap: bool = True):
         """
-        converts 3D coordinates to 2D screen position.
-        Returns (screen_x, screen_y, depth) where depth is used for sorting
+        Hand the rotations to projection, bumping view_version only when
+        the projected values actually move. Drags snap to ROTATION_STEP,
+        follow mode passes snap=False so its small easing steps keep
+        the view turning smoothly.
         """
-        # Apply camera rotations
-        # First rotate around Z axis (horizontal)
-        cos_z = math.cos(math.radians(self.rotation_z))
-        sin_z = math.sin(math.radians(self.rotation_z))
-        x_rot = x * cos_z - y * sin_z
-        y_rot = x * sin_z + y * cos_z
+        if snap:
+            view_rotation = (quantize(self.rotation_x, ROTATION_STEP),
+                             quantize(self.rotation_z, ROTATION_STEP))
+        else:
+            view_rotation = (self.rotation_x, self.rotation_z)
+        if view_rotation != self._view_rotation:
+            self._view_rotation = view_rotation
+            self.view_version += 1
+    
+    def rotation_matrix(self) -> np.ndarray:
+        """
+        Both camera rotations as one 3x3 matrix, rows give the
+        rotated x, y and z (depth) of a point.
         
-        # Then rotate around X axis (vertical tilt)
-        cos_x = math.cos(math.radians(self.rotation_x))
-        sin_x = math.sin(math.radians(self.rotation_x))
-        y_final = y_rot * cos_x - z * sin_x
-        z_final = y_rot * sin_x + z * cos_x
+        Rebuilt only when view_version has moved on since the last call.
+        """
+        if self._matrix_version != self.view_version:
+            rotation_x, rotation_z = self._view_rotation
+            cos_z = math.cos(math.radians(rotation_z))
+            sin_z = math.sin(math.radians(rotation_z))
+            cos_x = math.cos(math.radians(rotation_x))
+            sin_x = math.sin(math.radians(rotation_x))
+            self._matrix = np.array([
+                [cos_z, -sin_z, 0.0],
+                [sin_z * cos_x, cos_z * cos_x, -sin_x],
+                [sin_z * sin_x, cos_z * sin_x, cos_x],
+            ])
+            self._matrix_version = self.view_version
+        return self._matrix
+    
+    def project_many(self, points: np.ndarray, zoom: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts an (N, 3) array of 3D points to 2D screen positions.
+        Returns (screen_xy, depth) as an (N, 2) int32 array and an (N,) array
+        """
+        if _project_kernel is not None:
+            screen_xy = np.empty((len(points), 2), dtype=np.int32)
+            depth = np.empty(len(points))
+            _project_kernel(points, self.rotation_matrix(), float(self.distance), float(zoom), 
+                            float(self.center[0]), float(self.center[1]), screen_xy, depth)
+            return screen_xy, depth
         
-        # Apply perspective projection
-        perspective_scale = self.distance / (self.distance + z_final * zoom)
+        rotated = points @ self.rotation_matrix().T
+        depth = rotated[:, 2]
         
-        # Convert to screen coordinates
-        screen_x = int(self.center[0] + x_rot * zoom * perspective_scale)
-        screen_y = int(self.center[1] - y_final * zoom * perspective_scale)
+        scale = zoom * self.distance / (self.distance + depth * zoom)
         
-        # Return depth for sorting (further away = smaller value)
-        depth = z_final
+        screen_xy = np.empty((len(points), 2), dtype=np.int32)
+        screen_xy[:, 0] = self.center[0] + rotated[:, 0] * scale
+        screen_xy[:, 1] = self.center[1] - rotated[:, 1] * scale
         
-        return screen_x, screen_y, depth
+        return screen_xy, depth
     
     def handle_mouse_down(self, pos: Tuple[int, int]):
         """Start camera drag"""
@@ -119,18 +194,26 @@ class Camera3D:
             dx = pos[0] - self.last_mouse[0]
             dy = pos[1] - self.last_mouse[1]
             
-            # Update rotations (with some sensitivity scaling)
+            # Update rotations (with some sensitivity scaling), motion that
+            # doesn't move them to another ROTATION_STEP keeps every
+            # cached projection valid
             self.rotation_z += dx * 0.5
             self.rotation_x = max(-89, min(89, self.rotation_x + dy * 0.3))
+            self.sync_rotation()
             
             self.last_mouse = pos
     
     def handle_scroll(self, direction: int):
         """Zoom camera in/out"""
         if direction > 0:
-            self.distance = max(200, self.distance * 0.9)
+            distance = max(200, round(self.distance * 0.9))
         else:
-            self.distance = min(3000, self.distance * 1.1)
+            distance = min(3000, round(self.distance * 1.1))
+        
+        # scrolling against either limit changes nothing
+        if distance != self.distance:
+            self.distance = distance
+            self.view_version += 1
     
     def reset(self):
         """Reset camera to default position"""
@@ -138,6 +221,8 @@ class Camera3D:
         self.rotation_z = 0
         self.distance = 800
         self.follow_planet = None
+        self.sync_rotation()
+        self.view_version += 1
 
 
 @dataclass
@@ -150,6 +235,60 @@ class PlanetStyle:
     has_atmosphere: bool = False
 
 
+class Trail:
+    """
+    Fixed size ring buffer of recent 3D positions.
+    
+    Points are written in place into one preallocated array, once full
+    the oldest point is overwritten.
+    """
+    
+    def __init__(self, maxlen: int):
+        self.buffer = np.empty((maxlen, 3), dtype=np.float32)
+        self.head = 0   # where the next point goes
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, point: Tuple[float, float, float]):
+        self.buffer[self.head] = point
+        self.head = (self.head + 1) % len(self.buffer)
+        self.count = min(self.count + 1, len(self.buffer))
+    
+    def clear(self):
+        self.head = 0
+        self.count = 0
+    
+    def points(self) -> np.ndarray:
+        """The stored points oldest first, as an (N, 3) array"""
+        if self.count < len(self.buffer):
+            return self.buffer[:self.count]
+        return np.concatenate((self.buffer[self.head:], self.buffer[:self.head]))
+
+
+# control hints shown in the bottom right
+CONTROLS = [
+    "3D CONTROLS",
+    "Mouse Drag: Rotate",
+    "Scroll: Zoom",
+    "←/→: Day ±1",
+    "[/]: Month ±30",
+    "Space: Pause",
+    "F: Follow planet",
+    "1-8: Quick select",
+    "R: Reset camera",
+    "T: Today",
+]
+
+# Fonts are loaded by main() once pygame is initialised
+FONTS: Dict[str, pygame.font.Font] = {}
+
+# planet labels scale with depth, one font per size they can take
+LABEL_SIZES = range(10, 25)
+LABEL_FONTS: Dict[int, pygame.font.Font] = {}
+
+
 # Planet styles
 PLANET_STYLES = {
     "Sun": PlanetStyle(25, (255, 215, 0)),
@@ -232,10 +371,47 @@ PLANET_INFO = {
 }
 
 
+# the fun facts never change, wrap them for the info panel once
+for _info in PLANET_INFO.values():
+    _info['wrapped_fact'] = textwrap.wrap(_info['fact'], width=40)
+
+# static info panel widths, measured on first use per planet
+_info_widths: Dict[str, int] = {}
+
+# calculate_planet_distance results by (planet, minute after J2000)
+_distance_cache: Dict[Tuple[str, int], Dict[str, float]] = {}
+
+
 # Utility functions
-def clamp(value: float, min_val: float, max_val: float) -> float:
-    """Keep value in bounds"""
-    return max(min_val, min(max_val, value))
+def quantize(value: float, step: float) -> float:
+    """Round value to the nearest multiple of step"""
+    return round(value / step) * step
+
+
+def blend_over_background(color: Tuple[int, int, int, int]) -> Tuple[int, int, int]:
+    """Flatten a translucent colour onto the background so it can be drawn opaque"""
+    *rgb, alpha = color
+    return tuple(int(bg + (c - bg) * alpha / 255) 
+                 for c, bg in zip(rgb, COLORS['background']))
+
+
+# each planet's trail segment colours, oldest (faintest) first
+TRAIL_COLORS = {
+    name: [blend_over_background((*style.color, int(100 * (i + 1) / TRAIL_SEGMENTS)))
+           for i in range(TRAIL_SEGMENTS)]
+    for name, style in PLANET_STYLES.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(font_key: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Cached font.render with antialiasing.
+    
+    Most HUD strings are identical frame to frame, so this saves the glyph
+    rasterisation. Clear the cache if FONTS is ever reloaded.
+    """
+    return FONTS[font_key].render(text, True, color).convert_alpha()
 
 
 def format_date(dt: datetime) -> str:
@@ -250,12 +426,30 @@ def format_distance(au: float) -> str:
     return f"{au:.3f} AU"
 
 
-def calculate_planet_distance(planet_name: str, date: datetime) -> Dict[str, float]:
-    """Get planet distances and speed"""
-    x, y, z = elements_to_xy(PLANETS[planet_name], date)
+def calculate_planet_distance(planet_name: str, days: float) -> Dict[str, float]:
+    """
+    Get planet distances and speed, days after J2000.
+    
+    Computed from the frame's positions (days is the frame's own date so
+    elements_to_xy_all hits its cache) and kept per minute, the HUD's date
+    resolution, so the HUD and info panel share one result.
+    """
+    key = (planet_name, round(days * 1440))
+    distances = _distance_cache.get(key)
+    if distances is None:
+        if len(_distance_cache) >= 64:
+            _distance_cache.clear()
+        distances = _planet_distance(elements_to_xy_all(days), NAME_TO_IDX[planet_name])
+        _distance_cache[key] = distances
+    return distances
+
+
+def _planet_distance(positions: np.ndarray, idx: int) -> Dict[str, float]:
+    """Distances and speed of the planet in row idx of positions"""
+    x, y, z = positions[idx]
     distance_from_sun = math.sqrt(x*x + y*y + z*z)
     
-    earth_x, earth_y, earth_z = elements_to_xy(PLANETS["Earth"], date)
+    earth_x, earth_y, earth_z = positions[NAME_TO_IDX["Earth"]]
     distance_from_earth = math.sqrt(
         (x - earth_x)**2 + (y - earth_y)**2 + (z - earth_z)**2
     )
@@ -269,348 +463,466 @@ def calculate_planet_distance(planet_name: str, date: datetime) -> Dict[str, flo
     }
 
 
+def coalesce_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """
+    Merge overlapping rects with Rect.unionall so each restore blit
+    and display update covers its pixels once. Empty rects are dropped.
+    """
+    merged = []
+    for rect in rects:
+        if not rect:
+            continue
+        rect = pygame.Rect(rect)
+        hits = rect.collidelistall(merged)
+        while hits:
+            rect = rect.unionall([merged[i] for i in hits])
+            merged = [other for i, other in enumerate(merged) if i not in hits]
+            hits = rect.collidelistall(merged)
+        merged.append(rect)
+    return merged
+
+
+def clear_trails(trails: Dict[str, Trail]):
+    """Drop trail history, a big date jump would otherwise draw a chord across the orbit"""
+    for trail in trails.values():
+        trail.clear()
+
+
+def planet_at_position(pos: Tuple[int, int], 
+                       planet_positions: Dict[str, Tuple[int, int]]) -> Optional[str]:
+    """Planet under a screen position, nearest first, using last frame's positions"""
+    mouse_x, mouse_y = pos
+    # positions are in draw order (furthest first), so check the nearest first
+    for name, (px, py) in reversed(list(planet_positions.items())):
+        dx = mouse_x - px
+        dy = mouse_y - py
+        r = PLANET_STYLES[name].radius + 5
+        if dx*dx + dy*dy <= r*r:
+            return name
+    return None
+
+
 def auto_zoom_level(date: datetime) -> float:
     """Calculate initial zoom"""
-    max_dist = 0
-    for planet_data in PLANETS.values():
-        x, y, _ = elements_to_xy(planet_data, date)
-        dist = math.sqrt(x*x + y*y)
-        max_dist = max(max_dist, dist)
+    positions = elements_to_xy_all_from_date(date)
+    max_dist = float(np.hypot(positions[:, 0], positions[:, 1]).max())
     
     screen_radius = min(WINDOW_WIDTH, WINDOW_HEIGHT) // 2
     return max(20, int(screen_radius * 0.8 / max_dist))
 
 
 # 3D Drawing functions
-def draw_3d_starfield(screen: pygame.Surface, camera: Camera3D):
-    """Draw stars that appear to be at infinity"""
-    random.seed(42)  # Fixed seed for consistent stars
+def build_starfield(count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generate the star catalogue once.
     
-    for _ in range(STAR_COUNT):
+    Returns (positions, brightness, large) arrays, one entry per star, 
+    seeded so the sky is the same every run.
+    """
+    rng = random.Random(42)
+    positions = np.empty((count, 3))
+    brightness = np.empty(count, dtype=np.uint8)
+    large = np.empty(count, dtype=bool)
+    
+    for k in range(count):
         # Generate stars in a sphere around the viewer
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(-math.pi/2, math.pi/2)
+        theta = rng.uniform(0, 2 * math.pi)
+        phi = rng.uniform(-math.pi/2, math.pi/2)
         
         # Convert to cartesian at "infinite" distance
-        x = 1000 * math.cos(phi) * math.cos(theta)
-        y = 1000 * math.cos(phi) * math.sin(theta)
-        z = 1000 * math.sin(phi)
-        
-        # Project to screen
-        screen_x, screen_y, _ = camera.project_3d_to_2d(x, y, z, 1)
+        positions[k] = (1000 * math.cos(phi) * math.cos(theta),
+                        1000 * math.cos(phi) * math.sin(theta),
+                        1000 * math.sin(phi))
         
-        # Only draw if on screen
-        if 0 <= screen_x < screen.get_width() and 0 <= screen_y < screen.get_height():
-            brightness = random.randint(100, 255)
-            size = 2 if random.random() < 0.02 else 1
-            
-            if size == 2:
-                pygame.draw.circle(screen, (brightness, brightness, brightness), 
-                                 (screen_x, screen_y), size)
-            else:
-                screen.set_at((screen_x, screen_y), (brightness, brightness, brightness))
+        brightness[k] = rng.randint(100, 255)
+        large[k] = rng.random() < 0.02
+    
+    return positions, brightness, large
+
+
+@functools.lru_cache(maxsize=256)
+def build_star_sprite(brightness: int) -> pygame.Surface:
+    """Sprite for one of the larger stars, blitted with its top left 2px up and left"""
+    sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (brightness, brightness, brightness), (2, 2), 2)
+    return sprite.convert_alpha()
+
+
+def draw_3d_starfield(screen: pygame.Surface, camera: Camera3D, 
+                      stars: Tuple[np.ndarray, np.ndarray, np.ndarray]):
+    """Draw stars that appear to be at infinity"""
+    positions, brightness, large = stars
+    screen_xy, _ = camera.project_many(positions, 1)
+    
+    # Only draw if on screen
+    w, h = screen.get_size()
+    sx, sy = screen_xy[:, 0], screen_xy[:, 1]
+    visible = (sx >= 0) & (sx < w) & (sy >= 0) & (sy < h)
+    
+    # single pixel stars written straight into the surface in one go,
+    # the pixel view locks the surface so it has to go before blitting
+    small = visible & ~large
+    pixels = pygame.surfarray.pixels3d(screen)
+    pixels[sx[small], sy[small]] = brightness[small, None]
+    del pixels
+    
+    big = visible & large
+    screen.blits([(build_star_sprite(value), (x - 2, y - 2)) 
+                  for (x, y), value in zip(screen_xy[big].tolist(), brightness[big].tolist())], 
+                 doreturn=False)
+
+
+# reference grid, concentric circles at different AU distances in the 
+# orbital plane, one row of points per circle
+_grid_angles = np.radians(np.arange(0, 361, 10))
+GRID_POINTS = np.stack([
+    np.column_stack([au * np.cos(_grid_angles), au * np.sin(_grid_angles), 
+                     np.zeros(len(_grid_angles))])
+    for au in range(5, 35, 5)
+])
+
+
+@functools.lru_cache(maxsize=8)
+def build_grid_lines(camera: Camera3D, view_version: int, zoom: float) -> List[List[Tuple[int, int]]]:
+    """
+    Project the reference grid circles.
+    
+    Cached on the camera's view_version and zoom, the grid only moves
+    when the camera does.
+    """
+    circles, points_per_circle, _ = GRID_POINTS.shape
+    screen_xy, _ = camera.project_many(GRID_POINTS.reshape(-1, 3), zoom)
+    return screen_xy.reshape(circles, points_per_circle, 2).tolist()
 
 
 def draw_3d_grid(screen: pygame.Surface, camera: Camera3D, zoom: float):
     """Draw a 3D reference grid in the orbital plane"""
-    # Draw concentric circles at different AU distances
-    for au in range(5, 35, 5):
-        points = []
-        for angle in range(0, 361, 10):
-            x = au * math.cos(math.radians(angle))
-            y = au * math.sin(math.radians(angle))
-            z = 0
-            
-            screen_x, screen_y, depth = camera.project_3d_to_2d(x, y, z, zoom)
-            points.append((screen_x, screen_y))
-        
+    for points in build_grid_lines(camera, camera.view_version, zoom):
         # Draw the circle
         if len(points) > 2:
-            try:
-                pygame.draw.lines(screen, COLORS['grid'], False, points, 1)
-            except:
-                pass
+            pygame.draw.lines(screen, COLORS['grid'], False, points, 1)
 
 
-def draw_3d_sun(screen: pygame.Surface, camera: Camera3D, zoom: float):
-    """Draw sun with 3D positioning"""
-    screen_x, screen_y, depth = camera.project_3d_to_2d(0, 0, 0, zoom)
+@functools.lru_cache(maxsize=8)
+def build_sun_surface(radius: int) -> pygame.Surface:
+    """Sun body and core over a pre-baked radial gradient glow, as one sprite"""
+    glow = radius + 15
+    size = glow * 2
+    
+    # glow alpha falls off quadratically from the surface of the sun to its edge
+    xs = np.arange(size) + 0.5 - glow
+    r = np.sqrt(xs[:, None]**2 + xs[None, :]**2)
+    falloff = np.clip(1 - (r - radius) / (glow - radius), 0, 1)
+    
+    rgba = np.empty((size, size, 4), dtype=np.uint8)
+    rgba[..., :3] = COLORS['sun']
+    rgba[..., 3] = (SUN_GLOW_ALPHA * falloff**2).astype(np.uint8)
+    surf = pygame.image.frombuffer(rgba.tobytes(), (size, size), 'RGBA').convert_alpha()
+    
+    # Main sun
+    pygame.draw.circle(surf, PLANET_STYLES["Sun"].color, (glow, glow), radius)
+    pygame.draw.circle(surf, (255, 255, 200), (glow, glow), max(1, radius - 5))
+    return surf
+
+
+def draw_3d_sun(projected: Tuple[int, int, float], camera: Camera3D, zoom: float, blits: List):
+    """Queue the sun sprite, with 3D positioning, for the batched blit"""
+    screen_x, screen_y, depth = projected
     style = PLANET_STYLES["Sun"]
     
     # Scale based on distance
     scale = camera.distance / (camera.distance + depth * zoom)
     radius = int(style.radius * scale)
     
-    # Glow effect
-    for r in range(radius + 15, radius, -2):
-        alpha = int(30 * (radius + 15 - r) / 15)
-        glow_surf = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*COLORS['sun'], alpha), (r, r), r)
-        screen.blit(glow_surf, (screen_x - r, screen_y - r))
-    
-    # Main sun
-    pygame.draw.circle(screen, style.color, (screen_x, screen_y), radius)
-    pygame.draw.circle(screen, (255, 255, 200), (screen_x, screen_y), max(1, radius - 5))
+    sun_surf = build_sun_surface(radius)
+    half = sun_surf.get_width() // 2
+    blits.append((sun_surf, (screen_x - half, screen_y - half)))
 
 
-def draw_3d_orbit(screen: pygame.Surface, points: List, camera: Camera3D, 
+def draw_3d_orbit(screen: pygame.Surface, points: np.ndarray, camera: Camera3D, 
                   zoom: float, highlighted: bool = False):
     """Draw orbit in 3D space"""
-    screen_points = []
+    screen_xy, _ = camera.project_many(points, zoom)
     
-    for x, y, z in points:
-        screen_x, screen_y, depth = camera.project_3d_to_2d(x, y, z, zoom)
-        
-        # Check if point is reasonably on screen
-        margin = 200
-        if (-margin < screen_x < screen.get_width() + margin and 
-            -margin < screen_y < screen.get_height() + margin):
-            screen_points.append((screen_x, screen_y, depth))
-    
-    if len(screen_points) > 2:
-        # Sort by depth and draw back to front
-        color = COLORS['hud_accent'] if highlighted else COLORS['orbit']
-        width = 2 if highlighted else 1
-        
-        # Draw the orbit line
-        points_2d = [(x, y) for x, y, _ in screen_points]
-        try:
-            orbit_surf = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-            pygame.draw.lines(orbit_surf, color, False, points_2d, width)
-            screen.blit(orbit_surf, (0, 0))
-        except:
-            pass
+    # Keep points reasonably on screen
+    margin = 200
+    w, h = screen.get_size()
+    sx, sy = screen_xy[:, 0], screen_xy[:, 1]
+    visible = (sx > -margin) & (sx < w + margin) & (sy > -margin) & (sy < h + margin)
+    points_2d = screen_xy[visible].tolist()
+    
+    if len(points_2d) > 2:
+        if highlighted:
+            pygame.draw.lines(screen, COLORS['hud_accent'], False, points_2d, 2)
+        else:
+            pygame.draw.aalines(screen, blend_over_background(COLORS['orbit']), False, points_2d)
 
 
-def draw_3d_planet(screen: pygame.Surface, font: pygame.font.Font,
-                   name: str, position: Tuple[float, float, float],
-                   camera: Camera3D, zoom: float, trails: List,
-                   selected: bool = False) -> Tuple[int, int, float]:
-    """Draw planet in 3D space"""
-    x, y, z = position
-    screen_x, screen_y, depth = camera.project_3d_to_2d(x, y, z, zoom)
+def build_background(size: Tuple[int, int], camera: Camera3D, zoom: float, 
+                     stars: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                     orbits: Dict[str, np.ndarray], selected_planet: Optional[str]) -> pygame.Surface:
+    """
+    Stars, grid and orbits composed onto one opaque surface.
     
-    style = PLANET_STYLES[name]
+    None of these move unless the view, zoom, window size or selected planet
+    does, so the main loop keeps this around and blits it to start each frame.
+    The sun is left out, planets pass both in front of and behind it.
+    """
+    background = pygame.Surface(size).convert()
+    background.fill(COLORS['background'])
     
-    # Scale radius based on distance
-    scale = camera.distance / (camera.distance + depth * zoom)
-    radius = max(2, int(style.radius * scale))
+    draw_3d_starfield(background, camera, stars)
+    draw_3d_grid(background, camera, zoom)
     
-    # Don't draw if behind camera
-    if scale <= 0:
-        return screen_x, screen_y, depth
+    for name, orbit_points in orbits.items():
+        draw_3d_orbit(background, orbit_points, camera, zoom, name == selected_planet)
+    
+    return background
+
+
+@functools.lru_cache(maxsize=128)
+def build_planet_sprite(name: str, radius: int, ring_height: int, 
+                        selected: bool) -> pygame.Surface:
+    """
+    Selection ring, atmosphere, body, shading and rings baked into one sprite.
+    The sprite is square and centred on the planet.
+    """
+    style = PLANET_STYLES[name]
+    size = 2 * radius + 40
+    mid = size // 2
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
     
     # Selection indicator
     if selected:
-        pygame.draw.circle(screen, COLORS['hud_accent'], 
-                         (screen_x, screen_y), radius + 8, 3)
+        pygame.draw.circle(sprite, COLORS['hud_accent'], (mid, mid), radius + 8, 3)
     
     # Atmosphere
     if style.has_atmosphere:
-        atmo_radius = radius + 4
-        atmo_surf = pygame.Surface((atmo_radius*2, atmo_radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(atmo_surf, (*style.color, 30), 
-                         (atmo_radius, atmo_radius), atmo_radius)
-        screen.blit(atmo_surf, (screen_x - atmo_radius, screen_y - atmo_radius))
+        pygame.draw.circle(sprite, (*style.color, 30), (mid, mid), radius + 4)
     
     # Main planet
-    pygame.draw.circle(screen, style.color, (screen_x, screen_y), radius)
+    pygame.draw.circle(sprite, style.color, (mid, mid), radius)
     
     # Shading for 3D effect
     highlight = tuple(min(255, c + 50) for c in style.color)
     highlight_offset = radius // 3
-    pygame.draw.circle(screen, highlight, 
-                      (screen_x - highlight_offset, screen_y - highlight_offset), 
+    pygame.draw.circle(sprite, highlight, 
+                      (mid - highlight_offset, mid - highlight_offset), 
                       max(1, radius // 3))
     
-    # Saturn's rings (now properly 3D!)
-    if style.has_rings and style.ring_color:
-        # Calculate ring ellipse based on viewing angle
+    # Saturn's rings (now properly 3D!), ring_height follows the camera tilt
+    if style.has_rings and style.ring_color and ring_height > 1:
         ring_width = int((radius + 10) * 2)
-        ring_height = int(abs(6 * math.cos(math.radians(camera.rotation_x))))
-        
-        if ring_height > 1:  # Only draw if visible
-            ring_surf = pygame.Surface((ring_width + 20, ring_height + 20), pygame.SRCALPHA)
-            ring_rect = pygame.Rect(10, 10, ring_width, ring_height)
-            pygame.draw.ellipse(ring_surf, style.ring_color, ring_rect, 2)
-            screen.blit(ring_surf, (screen_x - ring_width//2 - 10, screen_y - ring_height//2 - 10))
-    
-    # Label with depth-based sizing
-    label_size = max(10, int(14 * scale))
-    label_font = pygame.font.Font(None, label_size)
-    label = label_font.render(name, True, COLORS['white'])
+        ring_rect = pygame.Rect(mid - ring_width//2, mid - ring_height//2, ring_width, ring_height)
+        pygame.draw.ellipse(sprite, style.ring_color, ring_rect, 2)
     
-    label_x = screen_x + radius + 5
-    label_y = screen_y - radius
+    return sprite.convert_alpha()
+
+
+@functools.lru_cache(maxsize=64)
+def build_label(name: str, size: int) -> Tuple[pygame.Surface, pygame.Surface]:
+    """Rendered planet name and its translucent backing"""
+    label = LABEL_FONTS[size].render(name, True, COLORS['white'])
     
     # Background for readability
     label_bg = pygame.Surface((label.get_width() + 4, label.get_height() + 2), pygame.SRCALPHA)
     label_bg.fill((0, 0, 0, 150))
-    screen.blit(label_bg, (label_x - 2, label_y - 1))
-    screen.blit(label, (label_x, label_y))
-    
-    # Update trail (in 3D!)
-    trails.append((x, y, z))
-    if len(trails) > MAX_TRAIL_LENGTH:
-        trails.pop(0)
-    
-    # Draw 3D trail
-    if len(trails) > 2:
-        for i in range(1, len(trails)):
-            trail_x, trail_y, trail_z = trails[i]
-            trail_screen_x, trail_screen_y, trail_depth = camera.project_3d_to_2d(
-                trail_x, trail_y, trail_z, zoom)
-            
-            alpha = int(100 * i / len(trails))
-            color = (*style.color, alpha)
-            
-            trail_scale = camera.distance / (camera.distance + trail_depth * zoom)
-            trail_size = max(1, int(3 * trail_scale))
-            
-            trail_surf = pygame.Surface((trail_size*2, trail_size*2), pygame.SRCALPHA)
-            trail_surf.fill(color)
-            screen.blit(trail_surf, (trail_screen_x - trail_size, trail_screen_y - trail_size))
+    return label.convert_alpha(), label_bg.convert_alpha()
+
+
+def draw_3d_planet(screen: pygame.Surface, name: str, 
+                   projected: Tuple[int, int, float], trail_xy: np.ndarray,
+                   camera: Camera3D, zoom: float,
+                   selected: bool, body_blits: List, 
+                   label_blits: List, dirty_rects: List):
+    """
+    Draw planet in 3D space, projected is its (screen_x, screen_y, depth)
+    and trail_xy its projected (N, 2) trail, oldest point first.
+    
+    The trail is drawn straight away (its bounds go on dirty_rects), the body
+    and label sprites are queued on body_blits / label_blits so all planets
+    go out in one blit each.
+    """
+    screen_x, screen_y, depth = projected
     
-    return screen_x, screen_y, depth
+    style = PLANET_STYLES[name]
+    
+    # Scale radius based on distance
+    scale = camera.distance / (camera.distance + depth * zoom)
+    radius = max(2, int(style.radius * scale))
+    
+    # Don't draw if behind camera
+    if scale <= 0:
+        return
+    
+    ring_height = int(abs(6 * math.cos(math.radians(camera.rotation_x)))) if style.has_rings else 0
+    sprite = build_planet_sprite(name, radius, ring_height, selected)
+    half = sprite.get_width() // 2
+    body_blits.append((sprite, (screen_x - half, screen_y - half)))
+    
+    # Label with depth-based sizing
+    label_size = min(LABEL_SIZES[-1], max(LABEL_SIZES[0], int(14 * scale)))
+    label, label_bg = build_label(name, label_size)
+    label_x = screen_x + radius + 5
+    label_y = screen_y - radius
+    label_blits.append((label_bg, (label_x - 2, label_y - 1)))
+    label_blits.append((label, (label_x, label_y)))
+    
+    # Draw 3D trail as a polyline that fades towards its tail
+    if len(trail_xy) > 2:
+        trail_xy = trail_xy.tolist()
+        
+        # a few graded segments, each sharing its end point with the next
+        step = math.ceil(len(trail_xy) / TRAIL_SEGMENTS)
+        for i, color in enumerate(TRAIL_COLORS[name]):
+            segment = trail_xy[i * step:(i + 1) * step + 1]
+            if len(segment) < 2:
+                break
+            dirty_rects.append(pygame.draw.aalines(screen, color, False, segment))
 
 
-def draw_3d_hud(screen: pygame.Surface, fonts: Dict, date: datetime, 
-                camera: Camera3D, zoom: float, paused: bool,
-                selected_planet: Optional[str] = None):
-    """Draw HUD with 3D camera info"""
-    font = fonts['normal']
-    font_title = fonts['title']
+def clear_render_caches():
+    """
+    Drop every cached projection and sprite.
+    
+    Cached surfaces are converted to the display's pixel format, which
+    can change when the window is recreated.
+    """
+    for cached in (build_star_sprite, build_grid_lines, build_sun_surface, 
+                   build_planet_sprite, build_label, build_text_panel, render_text):
+        cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def build_text_panel(size: Tuple[int, int], 
+                     lines: Tuple[Tuple[str, str, Tuple[int, int, int], Tuple[int, int]], ...],
+                     border: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+    """
+    A translucent panel with its text already on it, lines are
+    (text, font_key, color, position) with positions relative to the panel.
+    
+    Panels only change when their text does, so callers pass the full
+    content as the key and the result is reused until it changes. It is
+    built premultiplied so text blends onto the translucent panel the same
+    as it would onto the screen, blit it with BLEND_PREMULTIPLIED.
+    """
+    panel = pygame.Surface(size, pygame.SRCALPHA)
+    panel.fill(COLORS['hud_bg'])
+    panel = panel.premul_alpha()
     
+    for text, font_key, color, position in lines:
+        panel.blit(render_text(font_key, text, color).premul_alpha(), position, 
+                   special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    if border:
+        pygame.draw.rect(panel, border, panel.get_rect(), 2)
+    return panel.convert_alpha()
+
+
+def blit_panel(screen: pygame.Surface, panel: pygame.Surface, 
+               position: Tuple[int, int]) -> pygame.Rect:
+    """Blit a build_text_panel panel, returns the area drawn"""
+    return screen.blit(panel, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def draw_3d_hud(screen: pygame.Surface, date: datetime, days: float,
+                camera: Camera3D, zoom: float, paused: bool,
+                selected_planet: Optional[str] = None) -> pygame.Rect:
+    """Draw HUD with 3D camera info, returns the area drawn"""
     lines = [
-        ("3D Solar System Explorer", font_title, COLORS['hud_accent']),
-        (f"Date: {format_date(date)}", font, COLORS['hud_text']),
+        ("3D Solar System Explorer", 'title', COLORS['hud_accent']),
+        (f"Date: {format_date(date)}", 'normal', COLORS['hud_text']),
         (f"Camera: {camera.rotation_x:.0f}° tilt, {camera.rotation_z:.0f}° rotation", 
-         font, COLORS['hud_text']),
-        (f"Zoom: {100 * zoom / DEFAULT_ZOOM:.0f}%", font, COLORS['hud_text']),
-        (f"{'PAUSED' if paused else 'RUNNING'}", font, 
+         'normal', COLORS['hud_text']),
+        (f"Zoom: {100 * zoom / DEFAULT_ZOOM:.0f}%", 'normal', COLORS['hud_text']),
+        (f"{'PAUSED' if paused else 'RUNNING'}", 'normal', 
          (255, 100, 100) if paused else (100, 255, 100)),
     ]
     
     if camera.follow_planet:
-        lines.append((f"Following: {camera.follow_planet}", font, COLORS['hud_accent']))
+        lines.append((f"Following: {camera.follow_planet}", 'normal', COLORS['hud_accent']))
     
     if selected_planet:
-        distances = calculate_planet_distance(selected_planet, date)
+        distances = calculate_planet_distance(selected_planet, days)
         lines.append(
             (f"{selected_planet}: {format_distance(distances['sun_distance'])} from Sun", 
-             font, COLORS['hud_accent'])
+             'normal', COLORS['hud_accent'])
         )
     
-    max_width = max(f.size(text)[0] for text, f, _ in lines)
+    max_width = max(render_text(font_key, text, color).get_width() 
+                    for text, font_key, color in lines)
     panel_height = len(lines) * 25 + 20
     
-    panel = pygame.Surface((max_width + 40, panel_height), pygame.SRCALPHA)
-    panel.fill(COLORS['hud_bg'])
-    screen.blit(panel, (10, 10))
-    
-    y = 20
-    for text, font_to_use, color in lines:
-        rendered = font_to_use.render(text, True, color)
-        screen.blit(rendered, (20, y))
-        y += 25
-
-
-def draw_3d_controls(screen: pygame.Surface, font: pygame.font.Font):
-    """Draw 3D control hints"""
-    controls = [
-        "3D CONTROLS",
-        "Mouse Drag: Rotate",
-        "Scroll: Zoom",
-        "←/→: Day ±1",
-        "[/]: Month ±30",
-        "Space: Pause",
-        "F: Follow planet",
-        "1-8: Quick select",
-        "R: Reset camera",
-        "T: Today",
-    ]
-    
-    y = screen.get_height() - len(controls) * 18 - 20
+    placed = tuple((text, font_key, color, (10, 10 + i * 25)) 
+                   for i, (text, font_key, color) in enumerate(lines))
+    panel = build_text_panel((max_width + 40, panel_height), placed)
+    return blit_panel(screen, panel, (10, 10))
+
+
+def draw_3d_controls(screen: pygame.Surface) -> pygame.Rect:
+    """Draw 3D control hints, returns the area drawn"""
+    y = screen.get_height() - len(CONTROLS) * 18 - 20
     x = screen.get_width() - 160
     
-    panel = pygame.Surface((150, len(controls) * 18 + 10), pygame.SRCALPHA)
-    panel.fill(COLORS['hud_bg'])
-    screen.blit(panel, (x - 5, y - 5))
-    
-    for i, line in enumerate(controls):
-        color = COLORS['hud_accent'] if i == 0 else COLORS['hud_text']
-        text = font.render(line, True, color)
-        screen.blit(text, (x, y + i * 18))
+    # static, so this is the same cached panel every frame
+    placed = tuple((line, 'small', COLORS['hud_accent'] if i == 0 else COLORS['hud_text'], 
+                    (5, 5 + i * 18))
+                   for i, line in enumerate(CONTROLS))
+    panel = build_text_panel((150, len(CONTROLS) * 18 + 10), placed)
+    return blit_panel(screen, panel, (x - 5, y - 5))
 
 
-def draw_planet_info(screen: pygame.Surface, fonts: Dict, 
-                     planet_name: str, date: datetime):
-    """Planet info panel (same as before)"""
+def _static_info_width(planet_name: str, lines: List[str]) -> int:
+    """Widest of the info lines that never change for a planet, measured once"""
+    width = _info_widths.get(planet_name)
+    if width is None:
+        width = max(FONTS['small'].size(line)[0] for line in lines if line)
+        _info_widths[planet_name] = width
+    return width
+
+
+def draw_planet_info(screen: pygame.Surface, planet_name: str, 
+                     days: float) -> Optional[pygame.Rect]:
+    """Planet info panel (same as before), returns the area drawn"""
     if planet_name not in PLANET_INFO:
-        return
+        return None
     
     info = PLANET_INFO[planet_name]
-    distances = calculate_planet_distance(planet_name, date)
+    distances = calculate_planet_distance(planet_name, days)
     
-    lines = [
-        f"{planet_name.upper()}",
-        "",
+    # only the distance lines depend on the date
+    dynamic = [
         f"Distance from Sun: {format_distance(distances['sun_distance'])}",
         f"Distance from Earth: {format_distance(distances['earth_distance'])}",
         f"Orbital Speed: {distances['orbital_speed']:.1f} km/s",
-        "",
+    ]
+    static = [
         f"Mass: {info['mass_earth']:.2f} Earth masses",
         f"Gravity: {info['gravity']:.1f} m/s²",
         f"Day Length: {abs(info['day_hours']):.1f} hours",
         f"Moons: {info['moons']}",
-        f"Temperature: {info['temp_average']}°C",
+        f"Temperature: {info['temp_avg']}°C",
         "",
-        info['fact']
+        *info['wrapped_fact'],
     ]
+    lines = [f"{planet_name.upper()}", "", *dynamic, "", *static]
     
-    # wrap words
-    if len(info['fact']) > 40:
-        words = info['fact'].split()
-        wrapped = []
-        current = ""
-        for word in words:
-            if len(current + word) < 40:
-                current += word + " "
-            else:
-                wrapped.append(current.strip())
-                current = word + " "
-        if current:
-            wrapped.append(current.strip())
-        lines[-1:] = wrapped
-    
-    font = fonts['small']
-    max_width = max(font.size(line)[0] for line in lines if line)
+    max_width = max(_static_info_width(planet_name, [lines[0], *static]),
+                    *(render_text('small', line, COLORS['hud_text']).get_width() 
+                      for line in dynamic))
     panel_height = len(lines) * 18 + 20
     
     x = 20
     y = (screen.get_height() - panel_height) // 2
     
-    panel = pygame.Surface((max_width + 30, panel_height), pygame.SRCALPHA)
-    panel.fill(COLORS['hud_bg'])
-    screen.blit(panel, (x, y))
-    
-    pygame.draw.rect(screen, PLANET_STYLES[planet_name].color, 
-                    (x, y, max_width + 30, panel_height), 2)
-    
-    text_y = y + 10
-    for i, line in enumerate(lines):
-        if not line:
-            text_y += 18
-            continue
-        
-        if i == 0:
-            color = PLANET_STYLES[planet_name].color
-            text = fonts['normal'].render(line, True, color)
-        else:
-            text = font.render(line, True, COLORS['hud_text'])
-        
-        screen.blit(text, (x + 10, text_y))
-        text_y += 18
+    color = PLANET_STYLES[planet_name].color
+    placed = tuple(
+        (line, 'normal' if i == 0 else 'small', color if i == 0 else COLORS['hud_text'], 
+         (10, 10 + i * 18))
+        for i, line in enumerate(lines) if line
+    )
+    panel = build_text_panel((max_width + 30, panel_height), placed, color)
+    return blit_panel(screen, panel, (x, y))
 
 
 def get_start_date() -> datetime:
@@ -640,16 +952,21 @@ def main():
     current_date = get_start_date()
     print(f"Starting at: {format_date(current_date)}")
     
+    # daily positions around the start date, scrubbing through
+    # them is a lookup instead of a Kepler solve
+    load_position_table(days_since_j2000(current_date))
+    
     pygame.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("3D Solar System Explorer")
     clock = pygame.time.Clock()
     
-    fonts = {
+    FONTS.update({
         'title': pygame.font.Font(None, 20),
         'normal': pygame.font.Font(None, 16),
         'small': pygame.font.Font(None, 14)
-    }
+    })
+    LABEL_FONTS.update({size: pygame.font.Font(None, size) for size in LABEL_SIZES})
     
     # initialise 3d camera
     camera = Camera3D(WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -659,23 +976,47 @@ def main():
     paused = False
     show_help = True
     selected_planet = None
-    time_step = timedelta(hours=1)
+    time_step = timedelta(hours=1)  # simulated time per real second
+    step_seconds = time_step.total_seconds()  # never changes, so hoisted
+    
+    # Stars are fixed, only their projection changes with the camera
+    stars = build_starfield(STAR_COUNT)
     
     # Planet trails
-    trails = {name: [] for name in PLANETS.keys()}
+    trails = {name: Trail(MAX_TRAIL_LENGTH) for name in PLANETS.keys()}
     
     # Pre-calculate orbits
-    orbits = {name: generate_orbit_points(data) 
-              for name, data in PLANETS.items()}
+    orbits = {name: generate_orbit_points(data) for name, data in PLANETS.items()}
     
     planet_list = ["Mercury", "Venus", "Earth", "Mars", 
                    "Jupiter", "Saturn", "Uranus", "Neptune"]
     
+    # screen positions from the last drawn frame, for click selection
+    planet_positions = {}
+    
+    # the sun (at the origin, row 0) and every planet, projected together.
+    # Allocated once, the planet rows are refilled each frame
+    body_names = ['Sun'] + PLANET_NAMES
+    bodies = np.zeros((len(body_names), 3))
+    
+    # static background layer and what the last frame drew over it
+    background = None
+    last_view_state = None
+    last_dirty_rects = []
+    
     print("Drag mouse to rotate view, scroll to or use key controls to zoom.")
     
     running = True
     while running:
-        for event in pygame.event.get():
+        # real frame time, so the simulation speed doesn't depend on frame rate
+        dt = min(clock.tick(FPS), MAX_FRAME_MS) / 1000.0
+        
+        events = pygame.event.get()
+        # paused with no input and no follow-cam, the frame on screen
+        # is still correct so skip solving and drawing it again
+        needs_redraw = bool(events) or not paused or bool(camera.follow_planet)
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 
@@ -688,13 +1029,16 @@ def main():
                     show_help = not show_help
                 elif event.key == pygame.K_t:
                     current_date = datetime.utcnow()
+                    clear_trails(trails)
                 elif event.key == pygame.K_r:
                     camera.reset()
                     zoom = auto_zoom_level(current_date)
                 elif event.key == pygame.K_f:
-                    # to toggle 'follow mode'
-                    if selected_planet:
-                        camera.follow_planet = selected_planet if not camera.follow_planet else None
+                    # to toggle 'follow mode', turning it off needs no selection
+                    if camera.follow_planet:
+                        camera.follow_planet = None
+                    elif selected_planet:
+                        camera.follow_planet = selected_planet
                 
                 # use number keys to select planet for info
                 elif pygame.K_1 <= event.key <= pygame.K_8:
@@ -709,8 +1053,10 @@ def main():
                     current_date += timedelta(days=1)
                 elif event.key == pygame.K_LEFTBRACKET:
                     current_date -= timedelta(days=30)
+                    clear_trails(trails)
                 elif event.key == pygame.K_RIGHTBRACKET:
                     current_date += timedelta(days=30)
+                    clear_trails(trails)
                 elif event.key == pygame.K_COMMA:
                     current_date -= timedelta(hours=1)
                 elif event.key == pygame.K_PERIOD:
@@ -718,13 +1064,23 @@ def main():
                 
                 # Zoom controls
                 elif event.key == pygame.K_MINUS:
-                    zoom = clamp(zoom * 0.9, 20, 800)
+                    zoom = max(20, min(800, zoom * 0.9))
                 elif event.key in (pygame.K_EQUALS, pygame.K_PLUS):
-                    zoom = clamp(zoom * 1.1, 20, 800)
+                    zoom = max(20, min(800, zoom * 1.1))
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    camera.handle_mouse_down(event.pos)
+                    # clicking a planet toggles its selection, anywhere else drags
+                    clicked = planet_at_position(event.pos, planet_positions)
+                    if clicked and clicked == selected_planet:
+                        # deselecting the followed planet stops following it too
+                        selected_planet = None
+                        if camera.follow_planet == clicked:
+                            camera.follow_planet = None
+                    elif clicked:
+                        selected_planet = clicked
+                    else:
+                        camera.handle_mouse_down(event.pos)
                 elif event.button == 4:  # Scroll up
                     camera.handle_scroll(1)
                 elif event.button == 5:  # Scroll down
@@ -740,68 +1096,96 @@ def main():
             elif event.type == pygame.VIDEORESIZE:
                 camera.update_size(event.w, event.h)
                 screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                clear_render_caches()
+        
+        if not needs_redraw:
+            continue
         
         # Update time
         if not paused:
-            current_date += time_step / FPS
+            current_date += timedelta(seconds=step_seconds * dt)
+        
+        # every planet position for this frame in one pass, the date
+        # itself is only needed for display from here on
+        days = days_since_j2000(current_date)
+        positions = elements_to_xy_all(days)
         
         # Follow mode - update camera to track planet
         if camera.follow_planet and camera.follow_planet in PLANETS:
-            x, y, z = elements_to_xy(PLANETS[camera.follow_planet], current_date)
+            x, y, z = positions[NAME_TO_IDX[camera.follow_planet]]
             # camera rotation following planet
             angle = math.degrees(math.atan2(y, x))
             camera.rotation_z += (angle - camera.rotation_z - 90) * 0.05
+            camera.sync_rotation(snap=False)
         
-        # Clear screen
-        screen.fill(COLORS['background'])
-        
-        # draw 3d elements
-        draw_3d_starfield(screen, camera)
-        draw_3d_grid(screen, camera, zoom)
-        
-        # Collect all planets with depths for proper ordering
-        planet_draws = []
+        # Stars, grid and orbits only change with the view, rebuild them
+        # when it has moved and otherwise start the frame from the last one
+        view_state = (camera.view_version, zoom, screen.get_size(), selected_planet)
+        view_changed = view_state != last_view_state
+        if view_changed:
+            background = build_background(screen.get_size(), camera, zoom, 
+                                          stars, orbits, selected_planet)
+            screen.blit(background, (0, 0))
+        else:
+            # everything outside last frame's rects is still background
+            screen.blits([(background, rect, rect) for rect in last_dirty_rects], False)
         
-        # Add sun
-        sun_x, sun_y, sun_depth = camera.project_3d_to_2d(0, 0, 0, zoom)
-        planet_draws.append(('Sun', None, (0, 0, 0), sun_depth, False))
+        # Update trails (in 3D!), the ring buffers drop the oldest point themselves
+        bodies[1:] = positions
+        for name in PLANET_NAMES:
+            trails[name].append(positions[NAME_TO_IDX[name]])
         
-        # Add planets
-        for name in PLANETS:
-            x, y, z = elements_to_xy(PLANETS[name], current_date)
-            _, _, depth = camera.project_3d_to_2d(x, y, z, zoom)
-            is_selected = (name == selected_planet)
-            planet_draws.append((name, PLANETS[name], (x, y, z), depth, is_selected))
+        # bodies then every trail packed into one buffer for a single projection
+        trail_points = [trails[name].points() for name in PLANET_NAMES]
+        scene_xy, scene_depths = camera.project_many(np.concatenate([bodies, *trail_points]), zoom)
         
-        # sort planets by 'depth' , furtherst first
-        planet_draws.sort(key=lambda p: p[3], reverse=True)
+        depths = scene_depths[:len(bodies)]
+        order = np.argsort(-depths, kind='stable').tolist()
+        screen_xy, depths = scene_xy[:len(bodies)].tolist(), depths.tolist()
         
-        # orbits drawn behind planets
-        for name, orbit_points in orbits.items():
-            is_selected = (name == selected_planet)
-            draw_3d_orbit(screen, orbit_points, camera, zoom, is_selected)
+        trail_xy = {}
+        start = len(bodies)
+        for name, points in zip(PLANET_NAMES, trail_points):
+            trail_xy[name] = scene_xy[start:start + len(points)]
+            start += len(points)
         
-        # plents drawn in order
+        # bodies drawn furthest first, trails straight away and the sprites
+        # batched so every body and then every label goes out in one blit
         planet_positions = {}
-        for name, planet_data, position, depth, is_selected in planet_draws:
+        body_blits = []
+        label_blits = []
+        dirty_rects = []
+        for idx in order:
+            name = body_names[idx]
+            projected = (*screen_xy[idx], depths[idx])
             if name == 'Sun':
-                draw_3d_sun(screen, camera, zoom)
+                draw_3d_sun(projected, camera, zoom, body_blits)
             else:
-                screen_pos = draw_3d_planet(screen, fonts['small'], name, position,
-                                           camera, zoom, trails[name], is_selected)
-                planet_positions[name] = screen_pos[:2]  # Just x n y for click detection
+                draw_3d_planet(screen, name, projected, trail_xy[name], camera, zoom, 
+                               name == selected_planet, 
+                               body_blits, label_blits, dirty_rects)
+                planet_positions[name] = projected[:2]  # Just x n y for click detection
+        dirty_rects += screen.blits(body_blits)
+        dirty_rects += screen.blits(label_blits)
         
         # Draw UI
         if show_help:
-            draw_3d_hud(screen, fonts, current_date, camera, zoom, paused, selected_planet)
-            draw_3d_controls(screen, fonts['small'])
+            dirty_rects.append(
+                draw_3d_hud(screen, current_date, days, camera, zoom, paused, selected_planet))
+            dirty_rects.append(draw_3d_controls(screen))
         
         if selected_planet:
-            draw_planet_info(screen, fonts, selected_planet, current_date)
+            dirty_rects.append(draw_planet_info(screen, selected_planet, days))
         
-        # update display
-        pygame.display.flip()
-        clock.tick(FPS)
+        # update display. While the background holds only push what
+        # moved (now or last frame) to the window
+        dirty_rects = coalesce_rects(dirty_rects)
+        if view_changed:
+            pygame.display.flip()
+        else:
+            pygame.display.update(coalesce_rects(last_dirty_rects + dirty_rects))
+        last_view_state = view_state
+        last_dirty_rects = dirty_rects
     
     pygame.quit()
 
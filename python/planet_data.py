@@ -7,11 +7,82 @@ Elements are based on J2000.0 epoch values suitable for educational visualisatio
 
 """
 
+import functools
+import hashlib
 import math
-from datetime import datetime
-from typing import Tuple, List, Dict
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Tuple, List, Dict, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, NumPy paths are used without it
+    njit = None
 
 J2000_EPOCH = datetime(2000, 1, 1, 12, 0, 0)
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = 86400e6
+
+_TWO_PI = 2 * math.pi
+_DEG2RAD = math.pi / 180.0
+
+_ELEMENT_KEYS = ("a", "e", "i", "Omega", "omega", "M0", "period")
+
+
+@dataclass(frozen=True)
+class OrbitalElements:
+    """
+    Keplerian elements of one planet, angles in degrees.
+    
+    The orientation angles never change, so their sines and cosines
+    (and those of the longitude of perihelion, Omega + omega) and the
+    mean motion are worked out once when the elements are created.
+    Elements can still be read by name (elements["a"]) like a dict.
+    """
+    a: float
+    e: float
+    i: float
+    Omega: float
+    omega: float
+    M0: float
+    period: float
+    
+    n: float = field(init=False)  # mean motion (degrees per day)
+    cos_i: float = field(init=False)
+    sin_i: float = field(init=False)
+    cos_Omega: float = field(init=False)
+    sin_Omega: float = field(init=False)
+    cos_omega: float = field(init=False)
+    sin_omega: float = field(init=False)
+    cos_varpi: float = field(init=False)  # longitude of perihelion, Omega + omega
+    sin_varpi: float = field(init=False)
+    
+    def __post_init__(self):
+        derived = {"n": 360.0 / self.period}
+        for key in ("i", "Omega", "omega"):
+            angle = math.radians(getattr(self, key))
+            derived["cos_" + key] = math.cos(angle)
+            derived["sin_" + key] = math.sin(angle)
+        varpi = math.radians(self.Omega + self.omega)
+        derived["cos_varpi"] = math.cos(varpi)
+        derived["sin_varpi"] = math.sin(varpi)
+        for key, value in derived.items():
+            object.__setattr__(self, key, value)
+    
+    def __getitem__(self, key: str) -> float:
+        return getattr(self, key)
+    
+    @classmethod
+    def coerce(cls, elements) -> "OrbitalElements":
+        """Pass OrbitalElements through, build them from a plain dict"""
+        if isinstance(elements, cls):
+            return elements
+        return cls(**{key: elements[key] for key in _ELEMENT_KEYS})
+
 
 # Planetary orbital elements at J2000.0
 # a: semi-major axis (AU)
@@ -22,71 +93,84 @@ J2000_EPOCH = datetime(2000, 1, 1, 12, 0, 0)
 # M0: mean anomaly at epoch (degrees)
 # period: orbital period (days)
 PLANETS = {
-    "Mercury": {
-        "a": 0.387098, "e": 0.205630, "i": 7.0049,
-        "Omega": 48.331, "omega": 29.124, "M0": 174.796, 
-        "period": 87.969
-    },
-    "Venus": {
-        "a": 0.723332, "e": 0.006772, "i": 3.3947,
-        "Omega": 76.680, "omega": 54.884, "M0": 50.115,
-        "period": 224.701
-    },
-    "Earth": {
-        "a": 1.000000, "e": 0.016710, "i": 0.0000,
-        "Omega": -11.260, "omega": 114.207, "M0": 357.517,
-        "period": 365.256
-    },
-    "Mars": {
-        "a": 1.523679, "e": 0.093400, "i": 1.8506,
-        "Omega": 49.558, "omega": 286.503, "M0": 19.373,
-        "period": 686.980
-    },
-    "Jupiter": {
-        "a": 5.20260, "e": 0.048498, "i": 1.3033,
-        "Omega": 100.464, "omega": 273.867, "M0": 20.020,
-        "period": 4332.589
-    },
-    "Saturn": {
-        "a": 9.55491, "e": 0.055508, "i": 2.4852,
-        "Omega": 113.665, "omega": 339.392, "M0": 317.020,
-        "period": 10759.22
-    },
-    "Uranus": {
-        "a": 19.2184, "e": 0.046295, "i": 0.7730,
-        "Omega": 74.006, "omega": 96.998, "M0": 142.238,
-        "period": 30688.5
-    },
-    "Neptune": {
-        "a": 30.1104, "e": 0.008988, "i": 1.7700,
-        "Omega": 131.784, "omega": 272.846, "M0": 256.228,
-        "period": 60182.0
-    },
+    "Mercury": OrbitalElements(
+        a=0.387098, e=0.205630, i=7.0049,
+        Omega=48.331, omega=29.124, M0=174.796, 
+        period=87.969
+    ),
+    "Venus": OrbitalElements(
+        a=0.723332, e=0.006772, i=3.3947,
+        Omega=76.680, omega=54.884, M0=50.115,
+        period=224.701
+    ),
+    "Earth": OrbitalElements(
+        a=1.000000, e=0.016710, i=0.0000,
+        Omega=-11.260, omega=114.207, M0=357.517,
+        period=365.256
+    ),
+    "Mars": OrbitalElements(
+        a=1.523679, e=0.093400, i=1.8506,
+        Omega=49.558, omega=286.503, M0=19.373,
+        period=686.980
+    ),
+    "Jupiter": OrbitalElements(
+        a=5.20260, e=0.048498, i=1.3033,
+        Omega=100.464, omega=273.867, M0=20.020,
+        period=4332.589
+    ),
+    "Saturn": OrbitalElements(
+        a=9.55491, e=0.055508, i=2.4852,
+        Omega=113.665, omega=339.392, M0=317.020,
+        period=10759.22
+    ),
+    "Uranus": OrbitalElements(
+        a=19.2184, e=0.046295, i=0.7730,
+        Omega=74.006, omega=96.998, M0=142.238,
+        period=30688.5
+    ),
+    "Neptune": OrbitalElements(
+        a=30.1104, e=0.008988, i=1.7700,
+        Omega=131.784, omega=272.846, M0=256.228,
+        period=60182.0
+    ),
 }
 
 
+@functools.lru_cache(maxsize=16)
 def days_since_j2000(date: datetime) -> float:
-    """Calculate days elapsed since J2000.0 epoch"""
-    delta = date - J2000_EPOCH
-    return delta.days + delta.seconds / 86400.0
+    """Calculate days elapsed since J2000.0 epoch, to the microsecond"""
+    # whole microseconds to float then divide, the same steps numpy takes
+    # in days_since_j2000_vec so both give bit-identical days
+    return ((date - J2000_EPOCH) // _MICROSECOND) / _US_PER_DAY
+
+
+# microsecond resolution like datetime, and unlike nanoseconds it
+# covers dates far outside 1678-2262
+_J2000_DATETIME64 = np.datetime64(J2000_EPOCH, "us")
+
+
+def days_since_j2000_vec(dates) -> np.ndarray:
+    """
+    days_since_j2000 for an array of dates (datetime64 values or
+    datetime objects), in one int64 subtract and one divide.
+    """
+    return (np.asarray(dates, dtype="datetime64[us]") - _J2000_DATETIME64) / np.timedelta64(1, "D")
 
 
-def mean_anomaly(elements: Dict, date: datetime) -> float:
+def mean_anomaly(elements: OrbitalElements, date: datetime) -> float:
     """
     Calculate mean anomaly at given date.
     
     The mean anomaly increases linearly with time, representing
     where the planet would be if it moved at constant speed.
+    Returned in degrees within (-360, 360), negative before J2000
+    (solve_kepler normalises it either way).
     """
-    M0 = elements["M0"]
-    period = elements["period"]
+    elements = OrbitalElements.coerce(elements)
     days = days_since_j2000(date)
     
-    # Mean motion (degrees per day)
-    n = 360.0 / period
-    
-    # Current mean anomaly
-    M = (M0 + n * days) % 360.0
+    # Current mean anomaly, n is the precomputed mean motion
+    M = math.fmod(elements.M0 + elements.n * days, 360.0)
     return M
 
 
@@ -99,9 +183,12 @@ def solve_kepler(M_deg: float, eccentricity: float) -> float:
     
     Returns E in radians.
     """
-    # Convert to radians and normalize to [-pi, pi]
-    M = math.radians(M_deg % 360.0)
-    M = (M + math.pi) % (2 * math.pi) - math.pi
+    if _solve_kepler_kernel is not None:
+        return _solve_kepler_kernel(M_deg, eccentricity)
+    
+    # Convert to radians and normalize to [-pi, pi], fmod in degrees is
+    # exact so large M_deg keep their precision
+    M = math.remainder(math.fmod(M_deg, 360.0) * _DEG2RAD, _TWO_PI)
     
     # Initial guess - use M for low eccentricity, pi for high
     E = M if eccentricity < 0.8 else math.pi
@@ -120,6 +207,44 @@ def solve_kepler(M_deg: float, eccentricity: float) -> float:
     return E
 
 
+def solve_kepler_cached(M_deg: float, eccentricity: float) -> float:
+    """
+    Opt-in memoised solve_kepler.
+    
+    M is rounded to 1e-6 degrees and e to 1e-8 to form the cache key,
+    so E can be off by up to ~1e-8 radians. Only worth it when the same
+    (M, e) pairs come up again and again, nothing in this module uses it.
+    """
+    return _solve_kepler_quantized(round((M_deg % 360.0) * 1e6), round(eccentricity * 1e8))
+
+
+@functools.lru_cache(maxsize=4096)
+def _solve_kepler_quantized(M_micro_deg: int, e_q: int) -> float:
+    return solve_kepler(M_micro_deg * 1e-6, e_q * 1e-8)
+
+
+# Below this eccentricity four Newton steps from E = M always reach
+# double precision, which covers every planet
+_LOW_E_MAX = 0.3
+
+
+def solve_kepler_low_e(M_deg: float, eccentricity: float) -> float:
+    """
+    solve_kepler specialised for eccentricity < _LOW_E_MAX.
+    
+    A fixed four Newton steps written out in full, so there is no 
+    initial guess branch, loop or convergence test. Returns E in radians.
+    """
+    M = math.remainder(math.fmod(M_deg, 360.0) * _DEG2RAD, _TWO_PI)
+    e = eccentricity
+    
+    E = M + e * math.sin(M) / (1.0 - e * math.cos(M))  # first step from E = M
+    E -= (E - e * math.sin(E) - M) / (1.0 - e * math.cos(E))
+    E -= (E - e * math.sin(E) - M) / (1.0 - e * math.cos(E))
+    E -= (E - e * math.sin(E) - M) / (1.0 - e * math.cos(E))
+    return E
+
+
 def true_anomaly(E: float, eccentricity: float) -> float:
     """
     Calculate true anomaly from eccentric anomaly.
@@ -139,52 +264,65 @@ def true_anomaly(E: float, eccentricity: float) -> float:
     return nu
 
 
-def elements_to_xyz(elements: Dict, date: datetime) -> Tuple[float, float, float]:
+def elements_to_xyz(elements: OrbitalElements, date: datetime) -> Tuple[float, float, float]:
     """
     Convert orbital elements to 3D position.
     
     Returns (x, y, z) in AU, with the Sun at origin.
-    Coordinate system is J2000 ecliptic.
+    Coordinate system is J2000 ecliptic. Plain element dicts
+    are accepted too.
     """
-    # Unpack elements
-    a = elements["a"]  # semi-major axis
-    e = elements["e"]  # eccentricity
-    i = math.radians(elements["i"])  # inclination
-    Omega = math.radians(elements["Omega"])  # ascending node
-    omega = math.radians(elements["omega"])  # perihelion argument
+    elements = OrbitalElements.coerce(elements)
+    if _xyz_kernel is not None:
+        # one compiled call instead of the Python pipeline below
+        return _xyz_kernel(elements.a, elements.e, elements.M0, elements.n, 
+                           days_since_j2000(date), 
+                           elements.cos_i, elements.sin_i, elements.cos_Omega, 
+                           elements.sin_Omega, elements.cos_omega, elements.sin_omega)
+    
+    a = elements.a  # semi-major axis
+    e = elements.e  # eccentricity
     
-    # Calculate anomalies
-    M = mean_anomaly(elements, date)
-    E = solve_kepler(M, e)
-    nu = true_anomaly(E, e)
+    # Calculate anomalies, mean_anomaly inlined as elements is already coerced
+    M = math.fmod(elements.M0 + elements.n * days_since_j2000(date), 360.0)
+    E = solve_kepler_low_e(M, e) if e < _LOW_E_MAX else solve_kepler(M, e)
+    sin_E = math.sin(E)
+    cos_E = math.cos(E)
+    
+    if elements.i == 0.0:
+        # In the ecliptic plane (Earth) the whole rotation is one turn 
+        # by the longitude of perihelion, Omega + omega
+        x_orbital = a * (cos_E - e)
+        y_orbital = a * math.sqrt(1 - e * e) * sin_E
+        return (x_orbital * elements.cos_varpi - y_orbital * elements.sin_varpi,
+                x_orbital * elements.sin_varpi + y_orbital * elements.cos_varpi,
+                0.0)
     
     # Distance from Sun
-    r = a * (1 - e * math.cos(E))
+    denom = 1 - e * cos_E
+    r = a * denom
     
-    # Position in orbital plane
-    x_orbital = r * math.cos(nu)
-    y_orbital = r * math.sin(nu)
+    # True anomaly only ever appears through its sine and cosine, which 
+    # follow from E directly (same result as true_anomaly without the atan2)
+    cos_nu = (cos_E - e) / denom
+    sin_nu = math.sqrt(1 - e * e) * sin_E / denom
     
     # Rotate to ecliptic coordinates
     # This is a 3-1-3 Euler rotation: Omega, i, omega
-    u = omega + nu  # argument of latitude
-    
-    cos_u = math.cos(u)
-    sin_u = math.sin(u)
-    cos_Omega = math.cos(Omega)
-    sin_Omega = math.sin(Omega)
-    cos_i = math.cos(i)
-    sin_i = math.sin(i)
+    # u = omega + nu is the argument of latitude, expanded with 
+    # the angle sum identities
+    cos_u = elements.cos_omega * cos_nu - elements.sin_omega * sin_nu
+    sin_u = elements.sin_omega * cos_nu + elements.cos_omega * sin_nu
     
     # Apply rotation matrix
-    x = r * (cos_Omega * cos_u - sin_Omega * sin_u * cos_i)
-    y = r * (sin_Omega * cos_u + cos_Omega * sin_u * cos_i)
-    z = r * (sin_u * sin_i)
+    x = r * (elements.cos_Omega * cos_u - elements.sin_Omega * sin_u * elements.cos_i)
+    y = r * (elements.sin_Omega * cos_u + elements.cos_Omega * sin_u * elements.cos_i)
+    z = r * (sin_u * elements.sin_i)
     
     return x, y, z
 
 
-def elements_to_xy(elements: Dict, date: datetime) -> Tuple[float, float, float]:
+def elements_to_xy(elements: OrbitalElements, date: datetime) -> Tuple[float, float, float]:
     """
     Convenience function for 2D visualization.
     Returns same as elements_to_xyz but named for clarity.
@@ -192,43 +330,510 @@ def elements_to_xy(elements: Dict, date: datetime) -> Tuple[float, float, float]
     return elements_to_xyz(elements, date)
 
 
-def generate_orbit_points(elements: Dict, num_points: int = 200) -> List[Tuple[float, float, float]]:
+def generate_orbit_points(elements: OrbitalElements, num_points: int = 200) -> np.ndarray:
     """
     Generate points along a complete orbit.
     
     Creates a smooth orbital path by sampling positions
-    at regular true anomaly intervals.
+    at regular true anomaly intervals. Returns a closed 
+    (num_points + 1, 3) float32 array in AU. Orbits never change,
+    so the array is cached and shared between callers, it is read-only.
+    """
+    return _orbit_points(OrbitalElements.coerce(elements), num_points)
+
+
+def orbit_points_bytes(elements: OrbitalElements, num_points: int = 200) -> bytes:
+    """
+    generate_orbit_points as raw interleaved float32 x, y, z bytes
+    (native byte order), ready for a vertex buffer or base64 transport.
     """
-    a = elements["a"]
-    e = elements["e"]
-    i = math.radians(elements["i"])
-    Omega = math.radians(elements["Omega"])
-    omega = math.radians(elements["omega"])
+    return generate_orbit_points(elements, num_points).tobytes()
+
+
+@functools.lru_cache(maxsize=64)
+def _orbit_points(elements: OrbitalElements, num_points: int) -> np.ndarray:
+    """Uncached generate_orbit_points, keyed on the (frozen, hashable) elements"""
+    a = elements.a
+    e = elements.e
+    
+    # Sample the orbit uniformly in true anomaly, 0 to 2π inclusive
+    nu = np.linspace(0, 2 * math.pi, num_points + 1)
+    
+    cos_nu = np.cos(nu)
+    sin_nu = np.sin(nu)
+    
+    # Distance using orbit equation
+    r = a * (1 - e * e) / (1 + e * cos_nu)
     
-    points = []
+    # Convert to ecliptic coordinates, u = omega + nu
+    cos_u = elements.cos_omega * cos_nu - elements.sin_omega * sin_nu
+    sin_u = elements.sin_omega * cos_nu + elements.cos_omega * sin_nu
+    
+    points = np.empty((num_points + 1, 3), dtype=np.float32)
+    points[:, 0] = r * (elements.cos_Omega * cos_u - elements.sin_Omega * sin_u * elements.cos_i)
+    points[:, 1] = r * (elements.sin_Omega * cos_u + elements.cos_Omega * sin_u * elements.cos_i)
+    points[:, 2] = r * (sin_u * elements.sin_i)
+    points.flags.writeable = False
+    return points
+
+# Structure-of-arrays view of PLANETS, one float64 entry per planet in
+# PLANETS order. Lets the positions of every planet be solved in a single
+# vectorised pass instead of one scalar call per planet.
+@dataclass
+class PlanetTable:
+    """
+    Orbital elements as parallel arrays, one entry per planet in
+    PLANET_NAMES order. Angles are in degrees like PLANETS, their
+    sines and cosines are precomputed since the angles never change,
+    as is the mean motion n (degrees per day).
+    """
+    a: np.ndarray
+    e: np.ndarray
+    inc: np.ndarray
+    Omega: np.ndarray
+    omega: np.ndarray
+    M0: np.ndarray
+    period: np.ndarray
+    n: np.ndarray
+    cos_Omega: np.ndarray
+    sin_Omega: np.ndarray
+    cos_inc: np.ndarray
+    sin_inc: np.ndarray
+    cos_omega: np.ndarray
+    sin_omega: np.ndarray
     
-    # Sample the orbit uniformly in true anomaly
-    for j in range(num_points + 1):
-        # True anomaly from 0 to 2π
-        nu = 2 * math.pi * j / num_points
+    @classmethod
+    def from_planets(cls, planets: Dict[str, OrbitalElements], names: List[str]) -> "PlanetTable":
+        """Build the table from PLANETS"""
+        def column(key: str) -> np.ndarray:
+            return np.array([getattr(planets[name], key) for name in names], dtype=np.float64)
         
-        # Distance using orbit equation
-        r = a * (1 - e * e) / (1 + e * math.cos(nu))
+        return cls(
+            a=column("a"), e=column("e"), inc=column("i"), Omega=column("Omega"), 
+            omega=column("omega"), M0=column("M0"), period=column("period"), n=column("n"),
+            cos_Omega=column("cos_Omega"), sin_Omega=column("sin_Omega"),
+            cos_inc=column("cos_i"), sin_inc=column("sin_i"),
+            cos_omega=column("cos_omega"), sin_omega=column("sin_omega"),
+        )
+
+
+# PLANETS stays the readable source of the elements, all the
+# vectorised maths below works from TABLE
+PLANET_NAMES = list(PLANETS)
+NAME_TO_IDX = {name: idx for idx, name in enumerate(PLANET_NAMES)}
+TABLE = PlanetTable.from_planets(PLANETS, PLANET_NAMES)
+
+# The 3-1-3 rotation only depends on the (constant) orientation angles, so
+# fold it into the perifocal P and Q unit vectors once at import. A position
+# is then x_orb * P + y_orb * Q.
+_P = np.column_stack([
+    TABLE.cos_Omega * TABLE.cos_omega - TABLE.sin_Omega * TABLE.sin_omega * TABLE.cos_inc,
+    TABLE.sin_Omega * TABLE.cos_omega + TABLE.cos_Omega * TABLE.sin_omega * TABLE.cos_inc,
+    TABLE.sin_omega * TABLE.sin_inc,
+])
+_Q = np.column_stack([
+    -TABLE.cos_Omega * TABLE.sin_omega - TABLE.sin_Omega * TABLE.cos_omega * TABLE.cos_inc,
+    -TABLE.sin_Omega * TABLE.sin_omega + TABLE.cos_Omega * TABLE.cos_omega * TABLE.cos_inc,
+    TABLE.cos_omega * TABLE.sin_inc,
+])
+_B = TABLE.a * np.sqrt(1.0 - TABLE.e * TABLE.e)  # semi-minor axes
+
+
+# With numba installed positions come from a compiled kernel. Without
+# it Kepler's equation is seeded from a precomputed (M, e) table of cos(E) and
+# sin(E) with bilinear interpolation and refined by one Newton step, positions
+# agree with the full solve to ~1e-11 AU. Set HIGH_PRECISION to use the
+# iterative NumPy Newton solve instead.
+HIGH_PRECISION = False
+
+_LUT_M_STEPS = 256
+_LUT_E_STEPS = 64
+_LUT_E_MAX = 0.25  # covers every planet
+
+
+def _newton_kepler(M: np.ndarray, e: np.ndarray, iterations: int) -> np.ndarray:
+    """Vectorised Newton-Raphson for E (radians) from M (radians)"""
+    return _newton_kepler_from(M, M, e, iterations)
+
+
+def _newton_kepler_from(guess: np.ndarray, M: np.ndarray, e: np.ndarray, 
+                        iterations: int) -> np.ndarray:
+    """_newton_kepler starting from an explicit initial guess"""
+    ecc_anomaly = np.array(guess, dtype=np.float64)
+    for _ in range(iterations):
+        ecc_anomaly -= (ecc_anomaly - e * np.sin(ecc_anomaly) - M) / (1.0 - e * np.cos(ecc_anomaly))
+    return ecc_anomaly
+
+
+def solve_kepler_vec(M_deg: np.ndarray, eccentricity: np.ndarray) -> np.ndarray:
+    """
+    solve_kepler over whole arrays (M in degrees, broadcast against e).
+    
+    Runs a fixed 5 Newton steps with no per-element convergence test,
+    then at most 5 more while the worst residual is above tolerance
+    (the same 10 step cap as solve_kepler).
+    Returns E in radians, normalised to [-pi, pi] like solve_kepler.
+    """
+    M = np.radians(np.mod(M_deg, 360.0))
+    M = np.mod(M + math.pi, 2 * math.pi) - math.pi
+    e = np.asarray(eccentricity, dtype=np.float64)
+    
+    ecc_anomaly = np.where(e < 0.8, M, math.pi)
+    ecc_anomaly = _newton_kepler_from(ecc_anomaly, M, e, 5)
+    
+    # planets are converged by now, only high e needs the extra steps
+    for _ in range(5):
+        if np.max(np.abs(ecc_anomaly - e * np.sin(ecc_anomaly) - M), initial=0.0) < 1e-10:
+            break
+        ecc_anomaly = _newton_kepler_from(ecc_anomaly, M, e, 1)
+    return ecc_anomaly
+
+
+def _build_kepler_lut() -> np.ndarray:
+    """
+    Solve Kepler offline over the grid (e includes both end points).
+    
+    Returns the table flattened to rows of (cos E, sin E) so a lookup
+    gathers both values at once.
+    """
+    grid_M = np.linspace(0, 2 * math.pi, _LUT_M_STEPS, endpoint=False)[:, None]
+    grid_e = np.linspace(0, _LUT_E_MAX, _LUT_E_STEPS + 1)[None, :]
+    ecc_anomaly = _newton_kepler(np.broadcast_to(grid_M, (_LUT_M_STEPS, _LUT_E_STEPS + 1)),
+                                 grid_e, 20)
+    return np.stack([np.cos(ecc_anomaly).ravel(), np.sin(ecc_anomaly).ravel()], axis=1)
+
+
+KEPLER_LUT = _build_kepler_lut()
+
+# Eccentricities never change, so the e half of the lookup is fixed per
+# planet: the column of the two nearest e samples and their weights
+_lut_e = TABLE.e * (_LUT_E_STEPS / _LUT_E_MAX)
+_lut_e0 = np.minimum(_lut_e.astype(np.intp), _LUT_E_STEPS - 1)
+_lut_fe = _lut_e - _lut_e0
+_lut_e_cols = np.stack([_lut_e0, _lut_e0 + 1])
+_lut_e_weights = np.stack([1 - _lut_fe, _lut_fe])
+
+
+def _lut_kepler(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """cos(E) and sin(E) for each planet, table lookup plus one Newton step"""
+    m = M * (_LUT_M_STEPS / (2 * math.pi))
+    m0 = m.astype(np.intp)
+    fm = m - m0
+    m0 %= _LUT_M_STEPS
+    rows = np.stack([m0, (m0 + 1) % _LUT_M_STEPS]) * (_LUT_E_STEPS + 1)
+    weights = np.stack([1 - fm, fm])
+    
+    # all four corners in one gather, shape (2, 2, N, 2)
+    corners = KEPLER_LUT[rows[:, None, :] + _lut_e_cols[None, :, :]]
+    w = weights[:, None, :] * _lut_e_weights[None, :, :]
+    cos_E, sin_E = np.einsum("ijn,ijnk->kn", w, corners)
+    
+    # the interpolated seed is off by up to ~1e-4 rad, one Newton step on
+    # top brings that down to rounding level. The residual is wrapped into
+    # (-pi, pi] since atan2 and M can sit on opposite sides of 0.
+    E = np.arctan2(sin_E, cos_E)
+    cos_E, sin_E = np.cos(E), np.sin(E)
+    residual = (E - TABLE.e * sin_E - M + math.pi) % (2 * math.pi) - math.pi
+    E -= residual / (1.0 - TABLE.e * cos_E)
+    return np.cos(E), np.sin(E)
+
+
+# Small LRU of recent results. The renderer, HUD and info panel all ask
+# for the same date within a frame, so each frame only solves once.
+_POS_CACHE_SIZE = 4
+_pos_cache: "OrderedDict[float, np.ndarray]" = OrderedDict()
+
+
+def elements_to_xy_all(days: float) -> np.ndarray:
+    """
+    Positions of every planet, days after J2000.0.
+
+    Returns an (N, 3) array in AU, rows in PLANET_NAMES order
+    (use NAME_TO_IDX to look up a planet's row). The array is shared
+    with the cache so it is read-only.
+    """
+    positions = _pos_cache.get(days)
+    if positions is not None:
+        _pos_cache.move_to_end(days)
+        return positions
+    
+    positions = _interpolate_positions(days)
+    if positions is None:
+        positions = _solve_positions(days)
+    positions.flags.writeable = False
+    _pos_cache[days] = positions
+    if len(_pos_cache) > _POS_CACHE_SIZE:
+        _pos_cache.popitem(last=False)
+    return positions
+
+
+def elements_to_xy_all_from_date(date: datetime) -> np.ndarray:
+    """elements_to_xy_all for a datetime"""
+    return elements_to_xy_all(days_since_j2000(date))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _solve_kepler_kernel(M_deg, eccentricity):
+        """
+        Compiled solve_kepler, the same Newton iteration and early exit.
+        numba has no math.fmod or math.remainder so the [-pi, pi] wrap 
+        is explicit.
+        """
+        M = (M_deg % 360.0) * _DEG2RAD
+        if M > math.pi:
+            M -= _TWO_PI
+        
+        E = M if eccentricity < 0.8 else math.pi
+        for _ in range(10):
+            correction = ((E - eccentricity * math.sin(E) - M) 
+                          / (1.0 - eccentricity * math.cos(E)))
+            E -= correction
+            if abs(correction) < 1e-10:
+                break
+        return E
+    
+    @njit(cache=True, fastmath=True)
+    def _markley_kepler(M, e):
+        """
+        Markley (1995) closed form solve of Kepler's equation, M in [0, 2pi).
         
-        # Convert to ecliptic coordinates
-        u = omega + nu
+        A cubic starter good to ~1e-4 followed by one fifth order 
+        correction, so a fixed cost with a single sin/cos pair instead
+        of one pair per Newton step.
+        """
+        sign = 1.0
+        if M > math.pi:
+            M = 2 * math.pi - M
+            sign = -1.0
         
-        cos_u = math.cos(u)
-        sin_u = math.sin(u)
-        cos_Omega = math.cos(Omega)
-        sin_Omega = math.sin(Omega)
-        cos_i = math.cos(i)
-        sin_i = math.sin(i)
+        pi2 = math.pi * math.pi
+        alpha = (3 * pi2 + 1.6 * math.pi * (math.pi - M) / (1 + e)) / (pi2 - 6)
+        d = 3 * (1 - e) + alpha * e
+        q = 2 * alpha * d * (1 - e) - M * M
+        r = 3 * alpha * d * (d - 1 + e) * M + M * M * M
+        w = np.cbrt(abs(r) + math.sqrt(q * q * q + r * r)) ** 2
+        ecc_anomaly = (2 * r * w / (w * w + w * q + q * q) + M) / d
         
-        x = r * (cos_Omega * cos_u - sin_Omega * sin_u * cos_i)
-        y = r * (sin_Omega * cos_u + cos_Omega * sin_u * cos_i)
-        z = r * (sin_u * sin_i)
+        e_sin_E = e * math.sin(ecc_anomaly)
+        e_cos_E = e * math.cos(ecc_anomaly)
+        f0 = ecc_anomaly - e_sin_E - M
+        f1 = 1 - e_cos_E
+        d3 = -f0 / (f1 - 0.5 * f0 * e_sin_E / f1)
+        d4 = -f0 / (f1 + 0.5 * d3 * e_sin_E + d3 * d3 * e_cos_E / 6)
+        d5 = -f0 / (f1 + 0.5 * d4 * e_sin_E + d4 * d4 * e_cos_E / 6 - d4 * d4 * d4 * e_sin_E / 24)
+        return sign * (ecc_anomaly + d5)
+    
+    @njit(cache=True, fastmath=True)
+    def _kepler_rot_kernel(a, b, e, M, P, Q, out):
+        """
+        Kepler solve, orbital plane position and rotation fused in one loop.
+        The rotation comes in precomputed as the P and Q vectors, 
+        so the only trig left is on E.
+        """
+        for k in range(a.shape[0]):
+            ecc_anomaly = _markley_kepler(M[k], e[k])
+            
+            x_orbital = a[k] * (math.cos(ecc_anomaly) - e[k])
+            y_orbital = b[k] * math.sin(ecc_anomaly)
+            for j in range(3):
+                out[k, j] = x_orbital * P[k, j] + y_orbital * Q[k, j]
+    
+    @njit(cache=True, fastmath=True)
+    def _xyz_kernel(a, e, M0, n, days, cos_i, sin_i, cos_Omega, sin_Omega, cos_omega, sin_omega):
+        """
+        Whole of elements_to_xyz for one planet: mean anomaly, Kepler 
+        solve and the 3-1-3 rotation, using the OrbitalElements trig.
+        """
+        M = math.radians((M0 + n * days) % 360.0)
+        ecc_anomaly = _markley_kepler(M, e)
+        x_orbital = a * (math.cos(ecc_anomaly) - e)
+        y_orbital = a * math.sqrt(1 - e * e) * math.sin(ecc_anomaly)
         
-        points.append((x, y, z))
+        # perifocal P and Q vectors as in _P and _Q
+        x = (x_orbital * (cos_Omega * cos_omega - sin_Omega * sin_omega * cos_i)
+             - y_orbital * (cos_Omega * sin_omega + sin_Omega * cos_omega * cos_i))
+        y = (x_orbital * (sin_Omega * cos_omega + cos_Omega * sin_omega * cos_i)
+             - y_orbital * (sin_Omega * sin_omega - cos_Omega * cos_omega * cos_i))
+        z = (x_orbital * sin_omega + y_orbital * cos_omega) * sin_i
+        return x, y, z
+    
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _batched_kernel(a, b, e, M0, n, days, P, Q, out):
+        """
+        _kepler_rot_kernel for every date in days, dates spread over
+        all cores. Every (date, planet) is independent so the threads
+        never share anything but the read-only inputs.
+        """
+        for t in prange(days.shape[0]):
+            for k in range(a.shape[0]):
+                M = ((M0[k] + n[k] * days[t]) % 360.0) * _DEG2RAD
+                ecc_anomaly = _markley_kepler(M, e[k])
+                x_orbital = a[k] * (math.cos(ecc_anomaly) - e[k])
+                y_orbital = b[k] * math.sin(ecc_anomaly)
+                for j in range(3):
+                    out[t, k, j] = x_orbital * P[k, j] + y_orbital * Q[k, j]
+else:
+    _solve_kepler_kernel = None
+    _kepler_rot_kernel = None
+    _xyz_kernel = None
+    _batched_kernel = None
+
+
+def _solve_positions(days: float) -> np.ndarray:
+    """Uncached vectorised Kepler solve for elements_to_xy_all"""
+    M = np.radians(TABLE.M0 + TABLE.n * days) % (2 * math.pi)
+    
+    if _kepler_rot_kernel is not None:
+        # compiled kernel is exact and faster than either NumPy path
+        positions = np.empty((len(M), 3))
+        _kepler_rot_kernel(TABLE.a, _B, TABLE.e, M, _P, _Q, positions)
+        return positions
+    
+    if HIGH_PRECISION:
+        # planetary eccentricities are small enough that a fixed
+        # 6 Newton steps always converges
+        ecc_anomaly = _newton_kepler(M, TABLE.e, 6)
+        cos_E, sin_E = np.cos(ecc_anomaly), np.sin(ecc_anomaly)
+    else:
+        cos_E, sin_E = _lut_kepler(M)
+    
+    # Position in orbital plane (x towards perihelion)
+    x_orbital = TABLE.a * (cos_E - TABLE.e)
+    y_orbital = _B * sin_E
+    
+    return x_orbital[:, None] * _P + y_orbital[:, None] * _Q
+
+
+def elements_to_xy_all_batched(days: np.ndarray) -> np.ndarray:
+    """
+    elements_to_xy_all for many dates at once.
+    
+    Returns a (T, N, 3) array in AU for T dates. With numba the
+    dates are solved in parallel across cores, otherwise with 
+    NumPy Newton iterations (solve_kepler_vec).
+    """
+    days = np.asarray(days, dtype=np.float64)
+    if _batched_kernel is not None:
+        positions = np.empty((len(days), len(PLANET_NAMES), 3))
+        _batched_kernel(TABLE.a, _B, TABLE.e, TABLE.M0, TABLE.n, days, _P, _Q, positions)
+        return positions
+    
+    days = days[:, None]
+    ecc_anomaly = solve_kepler_vec(TABLE.M0 + TABLE.n * days, TABLE.e)
+    
+    x_orbital = TABLE.a * (np.cos(ecc_anomaly) - TABLE.e)
+    y_orbital = _B * np.sin(ecc_anomaly)
+    return x_orbital[..., None] * _P + y_orbital[..., None] * _Q
+
+
+def all_planets_xyz(dates: np.ndarray) -> np.ndarray:
+    """
+    Positions of every planet for an array of dates.
+    
+    dates can be datetime64 values or datetime objects. Returns a
+    (T, N, 3) array in AU, planets in PLANET_NAMES order.
+    """
+    return elements_to_xy_all_batched(days_since_j2000_vec(dates))
+
+
+# Positions sampled once a day over a century around the start date. Once
+# loaded, elements_to_xy_all interpolates over the four samples around
+# a date in range instead of solving Kepler, dates outside it
+# are still solved live. Tables are saved next to this file so later
+# runs only have to load them.
+POSITION_TABLE_YEARS = 50
+POSITION_TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".position_cache")
+
+_position_table: Optional[np.ndarray] = None
+_position_table_start = 0.0
+
+
+def _position_table_path(start: int, count: int) -> str:
+    """Cache file for a table, named by the elements it was built from"""
+    elements = np.stack([TABLE.a, TABLE.e, TABLE.inc, TABLE.Omega, 
+                         TABLE.omega, TABLE.M0, TABLE.period])
+    key = hashlib.sha1(elements.tobytes()).hexdigest()[:12]
+    return os.path.join(POSITION_TABLE_DIR, f"positions_{key}_{start}_{count}.npy")
+
+
+def _prune_position_tables(keep: str):
+    """
+    Delete every saved table except keep, only the latest is kept so 
+    starting at a different year each run doesn't pile up files
+    """
+    for filename in os.listdir(POSITION_TABLE_DIR):
+        other = os.path.join(POSITION_TABLE_DIR, filename)
+        if (filename.startswith("positions_") and filename.endswith(".npy") 
+                and other != keep):
+            try:
+                os.remove(other)
+            except OSError:
+                pass
+
+
+def load_position_table(center_days: float, years: int = POSITION_TABLE_YEARS):
+    """
+    Load, or build and save, the daily position table spanning
+    years either side of center_days.
+    
+    The span is snapped to whole 365 day blocks so every start date
+    in the same block shares one cache file.
+    """
+    global _position_table, _position_table_start
+    
+    start = (math.floor(center_days / 365) - years) * 365
+    count = 2 * years * 365 + 1
+    path = _position_table_path(start, count)
+    
+    table = None
+    if os.path.exists(path):
+        try:
+            table = np.load(path)
+        except (OSError, ValueError):
+            table = None  # unreadable, rebuild it below
+        if table is not None and table.shape != (count, len(PLANET_NAMES), 3):
+            table = None
+    
+    if table is None:
+        sample_days = start + np.arange(count, dtype=np.float64)
+        table = elements_to_xy_all_batched(sample_days).astype(np.float32)
+        try:
+            os.makedirs(POSITION_TABLE_DIR, exist_ok=True)
+            np.save(path, table)
+            _prune_position_tables(keep=path)
+        except OSError:
+            pass  # the disk copy is only a startup shortcut
+    
+    _position_table = table
+    _position_table_start = float(start)
+    _pos_cache.clear()
+
+
+def _interpolate_positions(days: float) -> Optional[np.ndarray]:
+    """
+    Cubic (4 point Lagrange) interpolation in the position table, None
+    when no table is loaded or days falls outside it.
+    
+    Linear interpolation is under a pixel but up to 4e-4 AU off, enough
+    to change the 3 decimal distances in the HUD and info panel. Cubic
+    brings that down to ~1e-6 AU.
+    """
+    if _position_table is None:
+        return None
+    
+    offset = days - _position_table_start
+    i0 = math.floor(offset)
+    if not 1 <= i0 < len(_position_table) - 2:
+        return None
     
-    return points
\ No newline at end of file
+    # weights for the samples at i0 - 1, i0, i0 + 1 and i0 + 2
+    t = offset - i0
+    weights = np.array([
+        -t * (t - 1) * (t - 2) / 6,
+        (t + 1) * (t - 1) * (t - 2) / 2,
+        -(t + 1) * t * (t - 2) / 2,
+        (t + 1) * t * (t - 1) / 6,
+    ])
+    samples = _position_table[i0 - 1:i0 + 3]
+    return (weights @ samples.reshape(4, -1)).reshape(-1, 3)